@@ -7,6 +7,9 @@ The following modules are imported for specific purposes:
 - Cython.Build: Provides the cythonize function to convert the .pyx file to a C extension.
 - numpy: Required to include NumPy headers during the compilation process.
 
+Bounds checking, negative index wraparound and memoryview initialization checks are disabled by the compiler
+directives at the top of lcs_cython.pyx, and the C code is always compiled at -O3 regardless of how Python was built.
+
 To build and compile the lcs_cython module, run the following command in your terminal:
 python setup.py build_ext --inplace
 '''
@@ -16,7 +19,7 @@ from Cython.Build import cythonize
 import numpy as np
 
 extensions = [
-    Extension("lcs_cython", ["lcs_cython.pyx"]),
+    Extension("lcs_cython", ["lcs_cython.pyx"], extra_compile_args = ["-O3"]),
 ]
 
 setup(
@@ -3,6 +3,11 @@ from Utilities          import *
 from LCS                import lcs_cython as cy
 from typing             import *
 from alive_progress     import alive_bar
+from concurrent.futures import ThreadPoolExecutor
+from collections        import deque
+from itertools          import cycle, islice
+import os
+import time
 
 class Matcher:
     '''
@@ -13,7 +18,10 @@ class Matcher:
     Attributes:
         storage        (Utility) : A Utility object containing the pq_dir and pq_name for finding the games for comparison.
         parser         (Parser)  : A Parser object containing a game to be compared against a Parquet storage of games.
-        bitboard_sums  (list)    : The sequence of bitboard sums captured within the supplied Parser object.
+        bitboard_sums  (ndarray) : The sequence of bitboard sums captured within the supplied Parser object, as uint64s.
+        position_index (ndarray) : The sorted, unique bitboard sums of the user's game, used to probe partitions for candidate rows.
+        position_codes (ndarray) : The user's bitboard sums as indices into position_index.
+        position_masks (ndarray) : The match masks of position_codes, shared by every call to the bit-parallel LCS length.
         partitions     (list)    : A list of dictionaries containing partition information.
         match          (tuple)   : A tuple containing the best matching PGN string, a list of 2 tuples for the start
                                    and end indices of the matching sequence, and the maximum sequence length. If no
@@ -21,7 +29,7 @@ class Matcher:
 
     Methods:
         process_partition : Processes a single partition and computes the LCS for it.
-        find_best_lcs     : Finds the best LCS across all partitions.
+        find_best_lcs     : Finds the best LCS across all partitions, processing them concurrently.
         __str__           : Returns a formatted string describing the best matching game and the longest matching sequence.
         __call__          : Executes find_best_lcs and optionally prints the result.
     '''
@@ -34,21 +42,51 @@ class Matcher:
         Instantiates a Matcher object for comparing a Parser game against a database of games for analysis.
         '''
 
-        self.storage       = storage
-        self.parser        = parser
-        self.bitboard_sums = [position.bitboard_integers for position in parser.positions]
-        self.partitions    = storage.get_metadata()
-        self.total_records = sum(self.partitions.values())
-        self.match         = (None, None, 0, 0)
+        self.storage        = storage
+        self.parser         = parser
+        self.bitboard_sums  = parser.board_sums
+        self.position_index = np.unique(self.bitboard_sums)
+        self.position_codes = np.searchsorted(self.position_index, self.bitboard_sums)
+        self.position_masks = cy.match_masks(self.position_codes, len(self.position_index))
+        self.partitions     = storage.get_metadata()
+        self.total_records  = sum(self.partitions.values())
+        self.match          = (None, None, 0, 0)
 
     def process_partition(self, part_id: int) -> Tuple[int, List[int]]:
         '''
         Processes a single partition and computes the LCS for it.
+
+        Rows whose board sum never occurs in the user's game cannot be part of a common subsequence, so the partition 
+        is first probed against the position_index and only the surviving rows are handed to the LCS kernel. The probe 
+        is a single vectorized binary search of every row into the sorted index, followed by one equality pass. Skipping 
+        those rows leaves the resulting length and start indices unchanged, as each one would only copy the DP column 
+        to its left.
+
+        The exact LCS length is then found with the bit-parallel kernel, and the full DP that recovers the start indices 
+        is only run for partitions that would improve on the best match so far.
+
+        Workers share self.match with find_best_lcs, so a partition that has already fallen below the best match when its 
+        worker starts is skipped outright. The best length only grows, so find_best_lcs stops before consuming it anyway.
         '''
 
-        partition = self.storage.from_parquet(partition = part_id, columns = ["board_sum"])
-        return cy.lcs_indices(np.array(self.bitboard_sums, dtype = np.uint64), 
-                              np.array(partition['board_sum'].tolist(), dtype = np.uint64))
+        if self.match[2] > part_id: return 0, None
+
+        board_sums = self.storage.column_array(partition = part_id, column = "board_sum")
+        slots      = np.searchsorted(self.position_index, board_sums).clip(max = len(self.position_index) - 1)
+        candidates = np.flatnonzero(self.position_index[slots] == board_sums)
+
+        # The LCS can be no longer than the number of candidate rows, so small candidate sets are pruned outright
+        if len(candidates) <= self.match[2]: return 0, None
+
+        # The bit-parallel LCS length is far cheaper than the full DP, which only needs to run if the partition can win
+        if cy.lcs_length(self.position_masks, slots[candidates]) <= self.match[2]: return 0, None
+
+        lcs_length, lcs_indices = cy.lcs_indices(self.bitboard_sums, board_sums[candidates], self.match[2])
+        if not lcs_length: return lcs_length, lcs_indices
+
+        # Relate the start of the sequence back to its row in the unfiltered partition
+        start = candidates[lcs_indices[1][0]]
+        return lcs_length, [lcs_indices[0], (start, start + lcs_length - 1)]
 
 
     def find_best_lcs(self) -> Tuple[Optional[str], Optional[List[Tuple[int, int]]], int]:
@@ -60,8 +98,15 @@ class Matcher:
         of the best LCS is greater than the total_ply of the next partition, as it's impossible for a longer LCS to exist in 
         the remaining partitions.
 
+        Partitions are dispatched to a thread pool in that same order, which runs them concurrently because the LCS kernel 
+        releases the GIL. Only one partition per worker is kept in flight, and the next one is submitted as each result is 
+        consumed, so every partition starts with the best match found up to that point and little work is left running 
+        once the early stop is reached. Results are still consumed one partition at a time in descending order, so the 
+        best match and the early stop are identical to a serial scan, and any partitions left queued after the stop are 
+        cancelled.
+
         A progress bar is displayed using the alive-progress package, showing the progress of the task and the longest 
-        sequence of ply found so far.
+        sequence of ply found so far. Its text is refreshed at most 30 times a second, and always on the last partition.
 
         Args:
             None
@@ -71,27 +116,48 @@ class Matcher:
         '''
 
         print()
-        with alive_bar(self.total_records, bar = 'smooth', dual_line = True) as bar:
+        workers    = os.cpu_count() or 1
+        partitions = iter(self.partitions.items())
+        with alive_bar(self.total_records, bar = 'smooth', dual_line = True) as bar, \
+             ThreadPoolExecutor(max_workers = workers) as executor:
+            in_flight = deque((total_ply, num_records, executor.submit(self.process_partition, total_ply)) 
+                              for total_ply, num_records in islice(partitions, workers))
             remaining = self.total_records
-            for total_ply, num_records in self.partitions.items():
+            shown     = 0.0
+            progress  = None
+            describe  = lambda ply, length: f'Reviewed all games ≥ {ply} ply. Longest sequence ({length}): {"".join(islice(cycle(["♟︎", "♙"]), length))}'
+            while in_flight:
+                total_ply, num_records, future = in_flight.popleft()
                 
                 if self.match[2] > total_ply:
                     bar(remaining)
+                    executor.shutdown(cancel_futures = True)
                     break
 
-                bar.text(f'Reviewed all games ≥ {total_ply} ply. Longest sequence ({self.match[2]}): {"".join(["♟︎", "♙"] * (self.match[2] // 2) + ["♟︎"] * (self.match[2] % 2))}')
+                # Keep each worker busy with the next partition while this one is consumed
+                upcoming = next(partitions, None)
+                if upcoming: in_flight.append((*upcoming, executor.submit(self.process_partition, upcoming[0])))
+
+                progress = (total_ply, self.match[2])
+                if time.monotonic() - shown >= 1 / 30:
+                    bar.text(describe(*progress))
+                    shown = time.monotonic()
+
                 bar(num_records)
                 remaining -= num_records
                 
-                lcs_length, lcs_indices = self.process_partition(total_ply)
+                lcs_length, lcs_indices = future.result()
                 if lcs_length > self.match[2]:
                     self.match = (None, lcs_indices, lcs_length, total_ply)
 
+            # The bar keeps its last text once it closes, so the final update is never skipped
+            if progress: bar.text(describe(*progress))
+
         # Retrieve the best match from storage
-        match_row    = self.storage.from_parquet(partition = self.match[3], columns = ['ply', 'pgn'], rows = [self.match[1][1][0]])
-        match_pgn    = match_row.iloc[0]['pgn']
+        match_row    = self.storage.from_parquet(partition = self.match[3], columns = ['ply', 'pgn'], rows = [self.match[1][1][0]])[0]
+        match_pgn    = match_row['pgn']
         match_parser = Parser(match_pgn, False)
-        game_start   = match_row.iloc[0]['ply']
+        game_start   = match_row['ply']
         game_indices = [self.match[1][0], (game_start, game_start + self.match[2] - 1)] # Relate indices to the start of the matched game
         
         self.match = (match_parser, game_indices, self.match[2], self.match[3])
@@ -12,14 +12,24 @@ class Navigator:
         parsers         (List[Parser]) : A list of Parser objects, each containing a game to be displayed in the slideshow.
         parser_index    (int)          : The index of the currently active Parser object.
         match_indices   (Tuple)        : An optional tuple with the start/end indices of the matching sequence between games from different Parsers.
+        active_indices  (Tuple)        : The start and end indices of the matching sequence for the active Parser, refreshed by toggle_parser.
+        end_index       (int)          : The final index in the list of Position objects for the active Parser, refreshed by toggle_parser.
         ply_index       (int)          : The current index in the list of Position objects from the active Parser.
         square_size     (int)          : The size of each square in the chessboard canvas.
+        button_props    (List[dict])   : The props of each navigation button, in the same order as the buttons.
+        live_buttons    (List[Tuple])  : The navigation buttons whose state can change for the loaded games, paired with their props.
+        button_states   (dict)         : The state each live button was last configured with.
         ts              (datetime)     : Timestamp indicating when the game was uploaded.
+        squares         (List[int])    : The canvas item IDs of the piece text on each of the 64 squares, created once.
+        drawn           (List[str])    : The piece currently drawn on each of the 64 squares.
+        dark_color      (str)          : The color currently filling the dark squares.
+        headings        (List[Tuple])  : The title and players/date label text for each Parser, formatted once.
+        heading_index   (int)          : The index of the Parser whose headings are currently shown.
+        pending         (str)          : The ID of a display_position call waiting for the event queue to drain, if any.
 
     Methods:
-        active_indices   : Returns the start and end indices of the matching sequence for the active Parser.
-        end_index        : Returns the final index in the list of Position objects for the active Parser.
         create_buttons   : Creates the navigation buttons and binds the appropriate actions to them.
+        create_squares   : Creates the canvas items for every square of the chessboard.
         toggle_parser    : Switches which parser is actively on-screen.
         update_ply_index : Updates the current index based on the button pressed and displays the new position.
         update_states    : Updates the state of navigation buttons based on the current position index.
@@ -38,18 +48,28 @@ class Navigator:
         self.parsers = [parser1]
         if parser2: self.parsers.append(parser2)
 
-        self.parser_index  = 0
-        self.match_indices = match_indices
-        self.ply_index     = 0
-        self.square_size   = 80
-        self.ts            = datetime.now().strftime('%b %d, %Y at %-I:%M %p')
-        self.root          = tk.Tk()
-        self.frame         = tk.Frame(self.root)
-        self.canvas        = tk.Canvas(self.root, width = self.square_size * 8, height = self.square_size * 8)
-        self.labels        = [tk.Label(self.root, font = ("Menlo", 20, "bold")),
-                              tk.Label(self.root, font = ("Menlo", 14, "italic")),
-                              tk.Label(self.root, font = ("Menlo", 12, "bold")),
-                              tk.Label(self.root, font = ("Menlo", 12))]
+        self.parser_index   = 0
+        self.match_indices  = match_indices
+        self.active_indices = match_indices[0] if match_indices else None
+        self.end_index      = len(parser1.positions) - 1
+        self.ply_index      = 0
+        self.square_size    = 80
+        self.ts             = datetime.now().strftime('%b %d, %Y at %-I:%M %p')
+        self.root           = tk.Tk()
+        self.frame          = tk.Frame(self.root)
+        self.canvas         = tk.Canvas(self.root, width = self.square_size * 8, height = self.square_size * 8)
+        self.squares        = self.create_squares()
+        self.drawn          = [None] * 64
+        self.dark_color     = None
+        self.labels         = [tk.Label(self.root, font = ("Menlo", 20, "bold"),   pady = 10),
+                               tk.Label(self.root, font = ("Menlo", 14, "italic"), pady = 0),
+                               tk.Label(self.root, font = ("Menlo", 12, "bold"),   pady = 10),
+                               tk.Label(self.root, font = ("Menlo", 12),           pady = 10)]
+        self.headings       = [(f"Game Uploaded on {self.ts}" if i == 0 else "Matched Game",
+                                f"{parser.metadata.get('White', '')} vs. {parser.metadata.get('Black', '')} ({parser.metadata.get('Date', '').split('.')[0]})")
+                               for i, parser in enumerate(self.parsers)]
+        self.heading_index  = None
+        self.pending        = None
 
         self.props = {"⇤": {"side": "left",  "key": "<Up>",    "action": lambda: 0,                                       "condition": lambda: self.ply_index    == 0},
                       "←": {"side": "left",  "key": "<Left>",  "action": lambda: max(self.ply_index - 1, 0),              "condition": lambda: self.ply_index    == 0},
@@ -58,77 +78,115 @@ class Navigator:
                       "↛": {"side": "left",  "key": "d",       "action": lambda: self.active_indices[1],                  "condition": lambda: self.ply_index    == self.active_indices[1]},
                       "⇥": {"side": "right", "key": "<Down>",  "action": lambda: self.end_index,                          "condition": lambda: self.ply_index    == self.end_index},
                       "→": {"side": "right", "key": "<Right>", "action": lambda: min(self.ply_index + 1, self.end_index), "condition": lambda: self.ply_index    == self.end_index}}
-        self.buttons = self.create_buttons()
-    
-    @property
-    def active_indices(self):
-        return self.match_indices[0] if self.parser_index == 0 else self.match_indices[1]
-
-    @property
-    def end_index(self):
-        return len(self.parsers[self.parser_index].positions) - 1
+        self.button_props  = list(self.props.values())
+        self.buttons, self.live_buttons = self.create_buttons()
+        self.button_states = {button: "normal" for button, _ in self.live_buttons}
     
     def create_buttons(self):
         '''
         Creates the navigation buttons and binds the appropriate actions to them. The actions include navigating 
         to the previous or next position and toggling between the loaded games. 
+
+        Buttons that can never be used for the loaded games, toggling with a single game or jumping through a match 
+        that was not supplied, are created disabled and left unbound. The remaining buttons are returned separately as 
+        the live ones, each paired with its props, so that update_states never has to reconfigure the others.
         '''
         
+        framed = frozenset({"↣", "↪", "↛"})
+        fixed  = {"↪"} if len(self.parsers) == 1 else set()
+        if not self.match_indices: fixed |= {"↣", "↛"}
+
         buttons = []
         for i, (k, v) in enumerate(self.props.items()):
-            self.root.bind(v['key'], lambda event, i=i: self.update_ply_index(i))
-            buttons.append(tk.Button(self.frame if k in ["↣", "↪", "↛"] else self.root, 
-                                text = k, font = ("Menlo", 30), command = lambda i=i: self.update_ply_index(i)))
-        return buttons
+            if k not in fixed: self.root.bind(v['key'], lambda event, i=i: self.update_ply_index(i))
+            buttons.append(tk.Button(self.frame if k in framed else self.root, 
+                                text = k, font = ("Menlo", 30), state = "disabled" if k in fixed else "normal",
+                                command = lambda i=i: self.update_ply_index(i)))
+        return buttons, [(button, self.button_props[i]) for i, (button, k) in enumerate(zip(buttons, self.props)) if k not in fixed]
     
+    def create_squares(self) -> List[int]:
+        '''
+        Creates the canvas items for every square of the chessboard once, as a rectangle filled with the square's color 
+        and a text item for its piece, and returns the IDs of the text items in square order.
+
+        Dark squares are tagged so that their color can be changed in a single call when the active Parser changes. A 
+        square is dark when its row and column have different parities, which is the lowest bit of i ^ (i >> 3).
+        '''
+
+        squares = []
+        for i in range(64):
+            y, x = divmod(i, 8)
+            x *= self.square_size
+            y *= self.square_size
+            self.canvas.create_rectangle(x, y, x + self.square_size, y + self.square_size, fill = "#E0E0E0",
+                                         tags = "dark" if (i ^ (i >> 3)) & 1 else "light")
+            squares.append(self.canvas.create_text(x + self.square_size / 2, y + self.square_size / 2 - self.square_size / 20, text = ' ', 
+                                                   font = ("Arial Unicode MS", int(self.square_size * 0.8)), fill = 'black'))
+        return squares
+
     def toggle_parser(self):
         '''
         Switches between the Parser objects in the parsers list and ensures an invalid ply_index isn't used upon switching.
         
         The parser_index is incremented and wrapped around the length of the parsers list to achieve this. If the current 
-        ply_index is beyond the end_index of the new active Parser, it is adjusted to that Parser's final ply.
+        ply_index is beyond the end_index of the new active Parser, it is adjusted to that Parser's final ply. This is the 
+        only place the active Parser changes, so its matching indices and end_index are looked up here once rather than 
+        on every step.
         '''
 
-        self.parser_index = (self.parser_index + 1) % len(self.parsers)
+        self.parser_index   = (self.parser_index + 1) % len(self.parsers)
+        self.active_indices = self.match_indices[self.parser_index] if self.match_indices else None
+        self.end_index      = len(self.parsers[self.parser_index].positions) - 1
         if self.ply_index > self.end_index: self.ply_index = self.end_index
         return self.ply_index
     
     def update_ply_index(self, i: int):
         '''
         Updates the current index based on the button pressed and displays the new position.
+
+        The index is updated straight away, but the display is deferred until Tk has handled every event already waiting 
+        in its queue. Presses that are already queued together, such as when the display falls behind, are then shown 
+        with a single redraw of the final position.
         '''
         
-        self.ply_index = self.props[self.buttons[i].cget('text')]["action"]()
-        self.display_position()
+        self.ply_index = self.button_props[i]["action"]()
+        if not self.pending: self.pending = self.root.after_idle(self.display_position)
 
     def update_states(self):
         '''
         Updates the state of navigation buttons based on the current position index.
+
+        Most steps leave every button as it was, so a button is only reconfigured when its state actually changes, such 
+        as on reaching either end of the game or the matching sequence. Each live button carries its own props, so 
+        its condition is called directly rather than looked up through the button's text.
         '''
 
-        for i in self.buttons:
-            i.config(state = "disabled" if self.props[i.cget('text')]["condition"]() else "normal")
+        for button, props in self.live_buttons:
+            state = "disabled" if props["condition"]() else "normal"
+            if self.button_states[button] != state:
+                button.config(state = state)
+                self.button_states[button] = state
 
     def draw_canvas(self, position: Position):
         '''
         Draws the chessboard corresponding to the current position.
 
-        This method creates a rectangle for each square on the chessboard and fills it with a color based on the square's 
-        index. It then adds the corresponding chess piece to the center of each square. The chessboard is drawn on the 
-        tkinter canvas, which is then packed and visible in the tkinter window.
+        The squares and pieces are persistent canvas items made by create_squares, so rather than redrawing the board, 
+        this method compares the position with what is already drawn. Only squares whose piece has changed are given 
+        new text, which is typically two to four per move, and the dark squares are only recolored when the active 
+        Parser changes.
         '''
 
-        board  = position.get_board()
-        colors = ["#E0E0E0", "#B0B0B0" if self.parser_index == 0 else "#A3B9CC"]
+        color = "#B0B0B0" if self.parser_index == 0 else "#A3B9CC"
 
-        for i, square in enumerate(square for row in board for square in row):
-            y, x = divmod(i, 8)
-            x *= self.square_size
-            y *= self.square_size
-            self.canvas.create_rectangle(x, y, x + self.square_size, y + self.square_size, 
-                                         fill = colors[(x // self.square_size + y // self.square_size) % 2])
-            self.canvas.create_text(x + self.square_size / 2, y + self.square_size / 2 - self.square_size / 20, text = square, 
-                                    font = ("Arial Unicode MS", int(self.square_size * 0.8)), fill = 'black')
+        if color != self.dark_color:
+            self.canvas.itemconfig("dark", fill = color)
+            self.dark_color = color
+
+        for i, square in enumerate(position.squares):
+            if square != self.drawn[i]:
+                self.canvas.itemconfig(self.squares[i], text = square)
+                self.drawn[i] = square
 
     def update_labels(self, 
                       parser   : Parser, 
@@ -138,15 +196,17 @@ class Navigator:
         position from the active Parser and updates the tkinter labels to display this information. 
         
         The labels include the timestamp or game title, the players and date of the game, the current move notation, 
-        and the result or current player's turn.
+        and the result or current player's turn. The first two only depend on the Parser, so they are formatted once in 
+        __init__ and only reconfigured when the active Parser changes.
         '''
 
-        metadata = parser.metadata
+        if self.heading_index != self.parser_index:
+            self.labels[0].config(text = self.headings[self.parser_index][0])
+            self.labels[1].config(text = self.headings[self.parser_index][1])
+            self.heading_index = self.parser_index
 
-        self.labels[0].config(text = f"Game Uploaded on {self.ts}" if self.parser_index == 0 else "Matched Game", pady = 10)
-        self.labels[1].config(text = f"{metadata.get('White', '')} vs. {metadata.get('Black', '')} ({metadata.get('Date', '').split('.')[0]})", pady = 0)
-        self.labels[2].config(text = f"{position.move_number}. {position.move_notation}", pady = 10)
-        self.labels[3].config(text = metadata.get('Result', '') if position.final_move else ("White to Move" if position.white_turn else "Black to Move"), pady = 10)
+        self.labels[2].config(text = f"{position.move_number}. {position.move_notation}")
+        self.labels[3].config(text = parser.metadata.get('Result', '') if position.final_move else ("White to Move" if position.white_turn else "Black to Move"))
 
     def pack_components(self):
         '''
@@ -155,32 +215,31 @@ class Navigator:
 
         for i in self.labels:  i.pack()
         self.canvas.pack()
-        for j in self.buttons: j.pack(side = self.props[j.cget('text')]['side'])
+        for j, props in zip(self.buttons, self.button_props): j.pack(side = props['side'])
         self.frame.pack()
 
     def display_position(self):
         '''
         Updates the display to show the current position and metadata. 
         
-        This method first clears the tkinter canvas and draws the new position. Then it updates the labels to show 
-        the correct metadata and position information. Finally, it packs all the GUI components into the tkinter 
-        window and updates the state of the navigation buttons. 
+        This method first brings the tkinter canvas up to date with the new position. Then it updates the labels to show 
+        the correct metadata and position information. Finally, it updates the state of the navigation buttons. The 
+        components themselves are packed once by __call__, since their layout never changes between positions.
         
         This method is called each time a navigation button is pressed to refresh the display.
         '''
 
-        parser   = self.parsers[self.parser_index]
-        position = parser.positions[self.ply_index]
+        self.pending = None
+        parser       = self.parsers[self.parser_index]
+        position     = parser.positions[self.ply_index]
 
-        self.canvas.delete("all")
         self.draw_canvas(position)
-
-        self.root.title("Navigator")
         self.update_labels(parser, position)
-        self.pack_components()
         self.update_states()
 
     def __call__(self):
 
+        self.root.title("Navigator")
+        self.pack_components()
         self.display_position()
         self.root.mainloop()
\ No newline at end of file
@@ -4,31 +4,46 @@ from chess    import pgn
 import io
 import os
 
+class MainlineBuilder(pgn.GameBuilder):
+    '''
+    A python-chess GameBuilder that only keeps a game's mainline. Variations are skipped by the PGN reader as it
+    tokenizes them, so their moves are never parsed or validated and no side-line nodes are built.
+    '''
+
+    def begin_variation(self) -> pgn.SkipType:
+        return pgn.SKIP
+
+    def end_variation(self) -> None:
+        pass
+
 class Parser:
     '''
     This class leverages the python-chess library to parse and validate PGN files, allowing the focus to be on
     storing positions as bitboards for Matcher.
 
     Attributes:
-        pgn_input (str)            : The file path of the PGN file to be parsed or an existing PGN string.
-        is_file   (bool)           : Whether or not the pgn_input provided is a path to a file or an existing PGN string.
-        game      (chess.pgn.Game) : The parsed PGN game object.
+        pgn_input  (str)            : The file path of the PGN file to be parsed or an existing PGN string.
+        is_file    (bool)           : Whether or not the pgn_input provided is a path to a file or an existing PGN string.
+        game       (chess.pgn.Game) : The parsed PGN game object.
+        board_sums (ndarray)        : The board sum of every position in the game, held in one contiguous uint64 array.
 
     Methods:
-        read_game     : Reads the PGN file or PGN string using the python-chess library and returns the game object.
-        get_metadata  : Returns a dictionary containing the metadata of the PGN file.
-        get_positions : Parses the PGN file and returns a list of Position objects for each position in the game.
+        read_game      : Reads the PGN file or PGN string using the python-chess library and returns the game object.
+        get_metadata   : Returns a dictionary containing the metadata of the PGN file.
+        get_positions  : Parses the PGN file and returns a list of Position objects for each position in the game.
+        get_board_sums : Returns the board sums of every position in the game as a single uint64 array.
     '''
 
     def __init__(self, 
                  pgn_input,
                  is_file  = True):
 
-        self.pgn_input = pgn_input
-        self.is_file   = is_file
-        self.game      = self.read_game()
-        self.positions = self.get_positions()
-        self.metadata  = self.get_metadata()
+        self.pgn_input  = pgn_input
+        self.is_file    = is_file
+        self.game       = self.read_game()
+        self.positions  = self.get_positions()
+        self.board_sums = self.get_board_sums()
+        self.metadata   = self.get_metadata()
 
     def read_game(self) -> pgn.Game:
         '''
@@ -37,6 +52,9 @@ class Parser:
         This method checks whether the pgn_input attribute is a file or a PGN string. If it is a file, it reads the
         file using the python-chess library. Otherwise, it creates a StringIO object, which is used to provide a 
         file-like interface to the PGN string, allowing the python-chess library to read it.
+
+        Only the mainline is needed to generate positions, so the game is built with MainlineBuilder, which has the 
+        reader skip over any variations instead of parsing them into the game tree.
         '''
 
         if not self.pgn_input:
@@ -45,10 +63,10 @@ class Parser:
 
         if self.is_file:
             with open(self.pgn_input, "r") as pgn_file:
-                return pgn.read_game(pgn_file)
+                return pgn.read_game(pgn_file, Visitor = MainlineBuilder)
         else:
             pgn_string = io.StringIO(self.pgn_input)
-            return pgn.read_game(pgn_string)
+            return pgn.read_game(pgn_string, Visitor = MainlineBuilder)
 
     def get_metadata(self) -> Dict[str, str]:
         '''
@@ -84,4 +102,20 @@ class Parser:
                                       bitboards     = Position.get_bitboards(board)))
 
         positions[-1].final_move = True
-        return positions
\ No newline at end of file
+        return positions
+
+    def get_board_sums(self) -> np.ndarray:
+        '''
+        Returns the board sums of every position in the game as a single uint64 array, in the order of positions.
+
+        Matcher compares games by their sequence of board sums alone, so collecting them here, once per parse, lets it 
+        take the whole sequence as one contiguous array rather than visiting each Position object itself.
+
+        The twelve bitboards of every position are laid out as one row of a uint64 matrix and summed along each row in 
+        a single reduction, which gives the same values as each Position's bitboard_integers without converting every 
+        bitboard to a NumPy scalar on its own.
+        '''
+
+        bitboards = np.array([list(position.bitboards.values()) for position in self.positions], dtype = np.uint64)
+
+        return bitboards.sum(axis = 1, dtype = np.uint64)
@@ -1,4 +1,5 @@
 from   typing    import *
+from   functools import cached_property
 import numpy     as np
 import chess
 
@@ -19,6 +20,7 @@ class Position:
         get_bitboards : Converts a python-chess Board object into a set of bitboards.
         apply_move    : Applies a given move to the current position and updates the bitboards, move history, and player turn accordingly.
         get_board     : Generates a 2D list representing the board state at a given ply.
+        squares       : The pieces on each of the 64 squares as a flat tuple, in the order get_board lists them.
         __str__       : Returns a textual representation of the board state at a given ply for easy visualization.
     '''
 
@@ -65,23 +67,18 @@ class Position:
         '''
         Converts a python-chess Board object into a set of bitboards.
 
-        This method iterates over each square on the given chess board. If a piece is present on a square,
-        it updates the corresponding bit in the appropriate bitboard.
+        python-chess already keeps the board as one bitboard per piece type and one per color, so each piece's bitboard 
+        is read directly as their intersection with pieces_mask, instead of looking up the piece on each of the 64 
+        squares. Castling, en passant and promotion are therefore reflected exactly as python-chess applied them.
 
         Using a static method allows this conversion to happen independently of any particular instance of the Position class.
         '''
         
-        bitboards         = {piece: 0 for piece in Position().bitboards.keys()}
         symbol_to_unicode = {'P': '♙', 'R': '♖', 'N': '♘', 'B': '♗', 'Q': '♕', 'K': '♔',
                              'p': '♟︎', 'r': '♜', 'n': '♞', 'b': '♝', 'q': '♛', 'k': '♚'}
 
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece:
-                piece_symbol = symbol_to_unicode[piece.symbol()]
-                bitboards[piece_symbol] |= 1 << square
-
-        return bitboards
+        return {piece: board.pieces_mask(chess.PIECE_SYMBOLS.index(symbol.lower()), symbol.isupper()) 
+                for symbol, piece in symbol_to_unicode.items()}
 
     def apply_move(self, move: Tuple[str, int, int]):
         '''
@@ -110,20 +107,38 @@ class Position:
                    break
 
         self.white_turn = not self.white_turn
+        self.__dict__.pop('squares', None)
          
     def get_board(self) -> List[List[str]]:
         '''
         Generates a 2D list representing the board state at a given ply.
+
+        Rather than testing all 64 bits of every bitboard, each bitboard is walked one set bit at a time by isolating 
+        and then clearing its lowest set bit, so the work follows the number of pieces on the board. The flattened result 
+        is cached per Position by squares, which is what Navigator reads when redrawing.
         '''
 
         board = [[' '] * 8 for _ in range(8)]
         for piece, bitboard in self.bitboards.items():
-            for square in (i for i in range(64) if (bitboard >> i) & 1):
-                row, col = 7 - (square // 8), square % 8
+            while bitboard:
+                square    = (bitboard & -bitboard).bit_length() - 1
+                row, col  = 7 - (square // 8), square % 8
                 board[row][col] = piece
+                bitboard &= bitboard - 1
 
         return board
 
+    @cached_property
+    def squares(self) -> Tuple[str, ...]:
+        '''
+        Returns the pieces on each of the 64 squares as a flat tuple, reading the board from get_board row by row.
+
+        Navigator compares this against what it has drawn on every step, so it is cached on the Position after the first 
+        access, and cleared by apply_move whenever the bitboards change.
+        '''
+
+        return tuple(square for row in self.get_board() for square in row)
+
     def __str__(self) -> str:
 
         board = self.get_board()
@@ -1,9 +1,10 @@
+import csv
 import os
 import sys
-import pandas as pd
+import numpy as np
 import pyarrow.parquet as pq
-from tkinter import filedialog
-from typing  import *
+from tkinter   import filedialog
+from typing    import *
 
 class Utility:
     '''
@@ -16,10 +17,12 @@ class Utility:
         pgn_path (str) : The path to the PGN file.
 
     Methods:
-        open_file    : Opens a file dialog and returns the selected file path as a string.
-        from_parquet : Reads a set of partitions from the Parquet dataset and returns them as a DataFrame. 
-        get_metadata : Retrieves the metadata for each partition in the Parquet dataset.
-        __call__     : Returns the path to the PGN file, which is obtained either from the command line arguments or a file dialog.
+        open_file      : Opens a file dialog and returns the selected file path as a string.
+        partition_path : Returns the path to the Parquet file for a given partition.
+        from_parquet   : Reads a set of partitions from the Parquet dataset and returns them as a list of row dictionaries. 
+        column_array   : Reads a single column of a partition into a NumPy array, caching it as a memory-mapped .npy file.
+        get_metadata   : Retrieves the metadata for each partition in the Parquet dataset.
+        __call__       : Returns the path to the PGN file, which is obtained either from the command line arguments or a file dialog.
     '''
 
     def __init__(self, pq_name: str = "Storage"):
@@ -45,26 +48,76 @@ class Utility:
 
         return file_path
 
+    def partition_path(self, partition: int) -> str:
+        '''
+        Returns the path to the Parquet file for a given partition.
+        '''
+
+        return os.path.join(self.pq_path, f"total_ply={partition}", 'data.parquet')
+
     def from_parquet(self, 
                      partition : int, 
                      columns   : List[str] = None, 
-                     rows      : List[int] = None) -> pd.DataFrame:
+                     rows      : List[int] = None) -> List[Dict[str, Any]]:
+        '''
+        Reads data from a Parquet file into a list of row dictionaries.
+
+        Only the requested columns are read, with string columns kept dictionary-encoded, and any row selection is 
+        applied before the rows are converted to Python objects.
+
+        Args:
+            partition: The partition name to read from.
+            columns:   A list of column names to include in each row. If None, all columns are included.
+            rows:      A list of row indices to include. If None, all rows are included.
+
+        Returns:
+            A list of dictionaries mapping column names to values for the specified partition, columns, and rows.
+        '''
+
+        with pq.ParquetFile(self.partition_path(partition), read_dictionary = columns) as pq_file:
+            table = pq_file.read(columns = columns)
+        if rows is not None: table = table.take(rows)
+
+        return table.to_pylist()
+
+    def column_array(self, 
+                     partition : int, 
+                     column    : str) -> np.ndarray:
         '''
-        Reads data from a Parquet file into a DataFrame.
+        Reads a single column of a partition directly into a NumPy array.
+
+        The first read of a column also saves it as an .npy file beside the partition, which later runs memory-map for 
+        as long as it is newer than the partition.
 
         Args:
             partition: The partition name to read from.
-            columns:   A list of column names to include in the DataFrame. If None, all columns are included.
-            rows:      A list of row indices to include in the DataFrame. If None, all rows are included.
+            column:    The name of the column to read.
 
         Returns:
-            A DataFrame containing the data from the specified partition, columns, and rows.
+            A NumPy array containing every value of the column in the specified partition.
         '''
 
-        df = pd.read_parquet(os.path.join(self.pq_path, f"total_ply={partition}", 'data.parquet'), columns = columns)
-        if rows is not None: df = df.iloc[rows]
+        pq_file  = self.partition_path(partition)
+        npy_file = os.path.join(os.path.dirname(pq_file), f'{column}.npy')
+
+        if os.path.exists(npy_file) and os.path.getmtime(npy_file) >= os.path.getmtime(pq_file):
+            return np.load(npy_file, mmap_mode = 'r')
+
+        with pq.ParquetFile(pq_file) as reader:
+            array = reader.read(columns = [column]).column(column).to_numpy()
+
+        # Write to a temporary file first so that a concurrent reader never maps a partially written cache
+        tmp_file = f'{npy_file}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_file, 'wb') as f: np.save(f, array)
+            os.replace(tmp_file, npy_file)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
 
-        return df
+        return array
 
     def get_metadata(self) -> dict:
         '''
@@ -76,7 +129,8 @@ class Utility:
             A dictionary mapping total_ply values to the number of records in the corresponding partition, sorted in descending order by total_ply.
         '''
 
-        partitions = pd.read_csv(os.path.join(self.pq_path, 'metadata.csv')).set_index('total_ply')['num_rows'].to_dict()
+        with open(os.path.join(self.pq_path, 'metadata.csv'), newline = '') as file:
+            partitions = {int(row['total_ply']): int(row['num_rows']) for row in csv.DictReader(file)}
 
         return dict(sorted(partitions.items(), 
                            key     = lambda item: item[0], 